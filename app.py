@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
+import base64
+import io
 from pathlib import Path
 
 # Set page config for a polished look
@@ -18,21 +20,99 @@ COLORS = {
     'text': '#1F2937'       # Dark gray
 }
 
-# Load sample datasets
+# Trace color sequences for charts with 3, 4, 5 and 7 series
+PALETTE3 = (COLORS['primary'], COLORS['secondary'], COLORS['accent'])
+PALETTE4 = PALETTE3 + (COLORS['gray'],)
+PALETTE5 = PALETTE4 + (COLORS['red'],)
+PALETTE7 = PALETTE5 + ('#8B5CF6', '#EC4899')
+
+# Logo inlined as a data URI so the browser does not fetch it on every rerun
+LOGO_DATA_URI = "data:image/png;base64," + base64.b64encode((Path(__file__).parent / "logo.png").read_bytes()).decode()
+
+LOGO_HTML = f"""
+<div style="text-align: center; margin-bottom: 20px;">
+    <img src="{LOGO_DATA_URI}" alt="Your Logo" width="150">
+</div>
+"""
+
+# Static HTML for the page styles and footer
+STYLES_HTML = f"""
+<style>
+.main {{
+    background: {COLORS['background']};
+    padding: 20px;
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+}}
+h1, h2, h3 {{
+    color: {COLORS['text']};
+    font-weight: bold;
+    margin-bottom: 10px;
+}}
+.stSidebar {{
+    background-color: {COLORS['primary']};
+    color: white;
+    padding: 10px;
+}}
+.stButton>button {{
+    background-color: {COLORS['secondary']};
+    color: white;
+    border: none;
+    padding: 5px 15px;
+    border-radius: 5px;
+}}
+.stSelectbox {{
+    background-color: #FFFFFF;
+    border-radius: 5px;
+    padding: 5px;
+}}
+.stMarkdown {{
+    line-height: 1.6;
+    color: {COLORS['text']};
+}}
+.footer {{
+    text-align: center;
+    color: {COLORS['text']};
+    margin-top: 20px;
+    padding: 10px;
+    background-color: rgba(255, 255, 255, 0.8);
+    border-radius: 5px;
+}}
+</style>
+"""
+
+FOOTER_HTML = """
+<div class="footer">
+    <p>Created for portfolio showcase | biult by Sammdetech.com</p>
+</div>
+"""
+
+# Line charts with more points than this (rows x traces) are drawn with WebGL (Scattergl) instead of SVG
+WEBGL_POINT_THRESHOLD = 1000
+
+# Number of recent filter selections kept in the weather frequency figure cache
+FILTER_STATE_LIMIT = 16
+
+# Heatmaps with more cells than this are pre-rasterized to a PNG instead of drawn cell by cell
+HEATMAP_RASTER_CELLS = 1_000_000
+
+# Rasterized heatmaps average their rows down to at most this many pixel rows
+HEATMAP_RASTER_HEIGHT = 1000
+
+# Load sample datasets (one cached read per file, only when a section needs it).
+# The Parquet files keep their dtypes: in the accident-level data 'Accident Cause', 'Region'
+# and 'Weather Conditions' are categorical and 'Year' is int16. Remaining int64 columns
+# (counts in the summary tables) are downcast to the smallest integer type that fits.
 @st.cache_data
-def load_data():
-    data_dir = Path(__file__).parent
-    main_data = pd.read_csv(data_dir / "sample_road_accident_data.csv")
-    yearly_data = pd.read_csv(data_dir / "yearly_accidents.csv")
-    monthly_data = pd.read_csv(data_dir / "monthly_accidents.csv")
-    daily_data = pd.read_csv(data_dir / "daily_accidents.csv")
-    time_data = pd.read_csv(data_dir / "time_accidents.csv")
-    road_type_data = pd.read_csv(data_dir / "road_type_severity.csv")
-    weather_data = pd.read_csv(data_dir / "weather_severity.csv")
-    severity_data = pd.read_csv(data_dir / "severity_by_cause.csv")
-    return main_data, yearly_data, monthly_data, daily_data, time_data, road_type_data, weather_data, severity_data
-
-main_data, yearly_data, monthly_data, daily_data, time_data, road_type_data, weather_data, severity_data = load_data()
+def load_data(filename):
+    data = pd.read_parquet(Path(__file__).parent / filename, engine='pyarrow')
+    int_columns = data.select_dtypes('int64').columns
+    data[int_columns] = data[int_columns].apply(pd.to_numeric, downcast='integer')
+    return data
+
+# Per-cause tables flipped so each cause becomes a column, indexed by `label` (day, time of day)
+@st.cache_data
+def load_transposed(filename, label):
+    return load_data(filename).set_index('Accident Cause').T.reset_index().rename(columns={'index': label})
 
 # Sidebar
 st.sidebar.title("Road Accident Dashboard")
@@ -49,312 +129,473 @@ section = st.sidebar.selectbox(
     ]
 )
 
-# Filters
-st.sidebar.subheader("Filters")
-selected_years = st.sidebar.multiselect("Select Years", sorted(main_data['Year'].unique()), default=sorted(main_data['Year'].unique()))
-selected_causes = st.sidebar.multiselect("Select Accident Causes", sorted(main_data['Accident Cause'].unique()), default=sorted(main_data['Accident Cause'].unique()))
-selected_regions = st.sidebar.multiselect("Select Regions", sorted(main_data['Region'].unique()), default=sorted(main_data['Region'].unique()))
-
-# Filter main data
-filtered_data = main_data[
-    (main_data['Year'].isin(selected_years)) &
-    (main_data['Accident Cause'].isin(selected_causes)) &
-    (main_data['Region'].isin(selected_regions))
-]
-
-# Helper function for styling
-def apply_styles():
-    st.markdown(
-        f"""
-        <style>
-        .main {{
-            background: {COLORS['background']};
-            padding: 20px;
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        }}
-        h1, h2, h3 {{
-            color: {COLORS['text']};
-            font-weight: bold;
-            margin-bottom: 10px;
-        }}
-        .stSidebar {{
-            background-color: {COLORS['primary']};
-            color: white;
-            padding: 10px;
-        }}
-        .stButton>button {{
-            background-color: {COLORS['secondary']};
-            color: white;
-            border: none;
-            padding: 5px 15px;
-            border-radius: 5px;
-        }}
-        .stSelectbox {{
-            background-color: #FFFFFF;
-            border-radius: 5px;
-            padding: 5px;
-        }}
-        .stMarkdown {{
-            line-height: 1.6;
-            color: {COLORS['text']};
-        }}
-        .footer {{
-            text-align: center;
-            color: {COLORS['text']};
-            margin-top: 20px;
-            padding: 10px;
-            background-color: rgba(255, 255, 255, 0.8);
-            border-radius: 5px;
-        }}
-        </style>
-        """,
-        unsafe_allow_html=True
+# Filter main data (uncached: only weather_counts_fig reads it, and that figure is cached)
+def get_filtered(years, causes, regions):
+    main_data = load_data("sample_road_accident_data.parquet")
+    mask = np.logical_and.reduce([
+        main_data['Year'].isin(years).to_numpy(),
+        main_data['Accident Cause'].isin(causes).to_numpy(),
+        main_data['Region'].isin(regions).to_numpy()
+    ])
+    return main_data[mask]
+
+# Weather condition counts for the filtered data
+def weather_counts(years, causes, regions):
+    # Histogram of the categorical codes; -1 marks missing values and is dropped
+    weather = get_filtered(years, causes, regions)['Weather Conditions']
+    codes = weather.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(weather.cat.categories))
+    return pd.Series(counts, index=weather.cat.categories).reindex(['Windy', 'Rainy', 'Clear', 'Snowy', 'Foggy']).fillna(0)
+
+# Sorted filter options for years, causes and regions
+@st.cache_data
+def filter_domains():
+    main_data = load_data("sample_road_accident_data.parquet")
+    return (
+        tuple(sorted(main_data['Year'].unique())),
+        tuple(sorted(main_data['Accident Cause'].unique())),
+        tuple(sorted(main_data['Region'].unique()))
     )
 
-apply_styles()
+# Sidebar filters, drawn only by the Weather Conditions section (the only one that reads the
+# accident-level data). Streamlit forgets a widget's state on runs that don't draw it, so each
+# selection is also copied to a plain session_state entry that seeds the widget's default.
+def sidebar_filters():
+    st.sidebar.subheader("Filters")
+    selections = []
+    for label, name, options in zip(
+        ["Select Years", "Select Accident Causes", "Select Regions"],
+        ['years', 'causes', 'regions'],
+        filter_domains()
+    ):
+        selected = st.sidebar.multiselect(
+            label,
+            options,
+            default=st.session_state.get(f'selected_{name}', options),
+            key=f'{name}_filter'
+        )
+        st.session_state[f'selected_{name}'] = selected
+        selections.append(tuple(sorted(selected)))
+    return tuple(selections)
+
+# The CSS must still be sent on every rerun: Streamlit removes any element a run does not redraw
+st.markdown(STYLES_HTML, unsafe_allow_html=True)
 
 # Logo (optional)
-st.markdown(
-    f"""
-    <div style="text-align: center; margin-bottom: 20px;">
-        <img src="https://via.placeholder.com/150" alt="Your Logo" width="150">
-    </div>
-    """,
-    unsafe_allow_html=True
-)
-
-# Section rendering
-st.title("Road Accident Analysis Dashboard")
+st.markdown(LOGO_HTML, unsafe_allow_html=True)
+
+# Chart builders (cached so reruns reuse the same figure objects)
+def stacked_bar_figure(data, x, columns, title, x_title, y_title, legend_title, colors):
+    fig = go.Figure()
+    for column, color in zip(columns, colors):
+        fig.add_bar(x=data[x], y=data[column], name=column, marker_color=color)
+    fig.update_layout(
+        barmode='stack',
+        title=title,
+        xaxis_title=x_title,
+        yaxis_title=y_title,
+        legend_title_text=legend_title,
+        hovermode='x unified',
+        spikedistance=0
+    )
+    return fig
+
+def line_figure(data, x, columns, title, x_title, y_title, legend_title, colors, line_shape='linear'):
+    fig = go.Figure()
+    # Large traces render through WebGL; spline smoothing is SVG-only, so it falls back to straight lines there
+    use_webgl = len(data) * len(columns) > WEBGL_POINT_THRESHOLD
+    trace = go.Scattergl if use_webgl else go.Scatter
+    for column, color in zip(columns, colors):
+        fig.add_trace(trace(
+            x=data[x],
+            y=data[column],
+            name=column,
+            mode='lines+markers',
+            line=dict(color=color, shape='linear' if use_webgl else line_shape)
+        ))
+    fig.update_layout(
+        title=title,
+        xaxis_title=x_title,
+        yaxis_title=y_title,
+        legend_title_text=legend_title,
+        hovermode='x unified',
+        spikedistance=0
+    )
+    return fig
+
+def raster_heatmap_figure(z, x_labels, y_labels, colormap):
+    # Imported here: this path only runs for very large tables and matplotlib is slow to import
+    from matplotlib import colormaps
+    from PIL import Image
+
+    # Average rows into at most HEATMAP_RASTER_HEIGHT pixel rows, then shade them into a single
+    # PNG so the browser draws one image instead of one element per cell
+    edges = np.linspace(0, len(z), min(len(z), HEATMAP_RASTER_HEIGHT) + 1).astype(int)
+    starts, ends = edges[:-1], edges[1:]
+    binned = np.add.reduceat(z.astype(float), starts, axis=0) / (ends - starts)[:, None]
+    z_min, z_max = binned.min(), binned.max()
+    normalized = (binned - z_min) / (z_max - z_min) if z_max > z_min else np.zeros(binned.shape)
+    cmap = colormaps[colormap]
+    buffer = io.BytesIO()
+    Image.fromarray((cmap(normalized) * 255).astype(np.uint8)).save(buffer, format='PNG')
+
+    # One pixel per cell of the binned matrix, so hover text is indexed [pixel row][column]
+    row_labels = [
+        y_labels[start] if end - start == 1 else f"{y_labels[start]} … {y_labels[end - 1]} ({end - start} rows, mean)"
+        for start, end in zip(starts, ends)
+    ]
+    hover_text = [
+        [f"{row_label}<br>{x_label}: {value:,.0f}" for x_label, value in zip(x_labels, row)]
+        for row_label, row in zip(row_labels, binned)
+    ]
+    fig = go.Figure(go.Image(
+        source="data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode(),
+        hovertext=hover_text,
+        hovertemplate="%{text}<extra></extra>"
+    ))
 
-if section == "Yearly Trends":
-    st.header("Yearly Trends in Road Accidents")
-    # Stacked Bar Chart
-    fig_bar = px.bar(
-        yearly_data,
+    # The image trace has no colorbar of its own; an empty marker trace carries the same scale
+    fig.add_scatter(
+        x=[None],
+        y=[None],
+        mode='markers',
+        showlegend=False,
+        hoverinfo='skip',
+        marker=dict(
+            colorscale=[
+                [i / 10, 'rgb({:.0f}, {:.0f}, {:.0f})'.format(*(channel * 255 for channel in cmap(i / 10)[:3]))]
+                for i in range(11)
+            ],
+            cmin=z_min,
+            cmax=z_max,
+            color=[z_min],
+            showscale=True
+        )
+    )
+    tick_rows = np.unique(np.linspace(0, len(starts) - 1, min(len(starts), 20)).astype(int))
+    fig.update_xaxes(tickvals=list(range(len(x_labels))), ticktext=x_labels)
+    fig.update_yaxes(scaleanchor=False, tickvals=tick_rows.tolist(), ticktext=[y_labels[starts[i]] for i in tick_rows])
+    return fig
+
+@st.cache_resource
+def yearly_bar_fig():
+    return stacked_bar_figure(
+        load_data("yearly_accidents.parquet"),
         x='Year',
-        y=['Weather', 'Drunk Driving', 'Mechanical Failure', 'Speeding', 'Distracted Driving'],
+        columns=['Weather', 'Drunk Driving', 'Mechanical Failure', 'Speeding', 'Distracted Driving'],
         title="Accident Causes by Year",
-        labels={'value': 'Number of Accidents', 'variable': 'Accident Cause'},
-        color_discrete_sequence=[COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['gray'], COLORS['red']]
+        x_title='Year',
+        y_title='Number of Accidents',
+        legend_title='Accident Cause',
+        colors=PALETTE5
     )
-    fig_bar.update_layout(barmode='stack')
-    st.plotly_chart(fig_bar, use_container_width=True)
 
-    # Line Chart
-    fig_line = px.line(
-        yearly_data,
+@st.cache_resource
+def yearly_line_fig():
+    return line_figure(
+        load_data("yearly_accidents.parquet"),
         x='Year',
-        y='Total',
+        columns=['Total'],
         title="Total Road Accidents Per Year",
-        labels={'Total': 'Number of Accidents'},
-        line_shape='spline',
-        markers=True,
-        color_discrete_sequence=[COLORS['accent']]
+        x_title='Year',
+        y_title='Number of Accidents',
+        legend_title=None,
+        colors=(COLORS['accent'],),
+        line_shape='spline'
     )
-    st.plotly_chart(fig_line, use_container_width=True)
-
-    st.markdown("""
-    ### Data Storytelling: Yearly Trends in Road Accident Causes
-    This grouped table reveals how various accident causes have evolved over the years...
-    - **Overspeeding** consistently dominates the chart...
-    - **Driver inattention** and **alcohol influence** also maintain a persistent presence...
-    - The year **2002** recorded the **highest number of total road accidents (5,433)**...
-    - Continued investment in **speed control technologies**, **public education**, and **law enforcement** is essential...
-    """)
-
-elif section == "Monthly Trends":
-    st.header("Monthly Trends in Road Accidents")
-    # Stacked Bar Chart
-    fig_bar = px.bar(
-        monthly_data,
+
+@st.cache_resource
+def monthly_bar_fig():
+    return stacked_bar_figure(
+        load_data("monthly_accidents.parquet"),
         x='Month',
-        y=['Distracted Driving', 'Drunk Driving', 'Mechanical Failure', 'Speeding', 'Weather'],
+        columns=['Distracted Driving', 'Drunk Driving', 'Mechanical Failure', 'Speeding', 'Weather'],
         title="Accident Causes by Month",
-        labels={'value': 'Number of Accidents', 'variable': 'Accident Cause'},
-        color_discrete_sequence=[COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['gray'], COLORS['red']]
+        x_title='Month',
+        y_title='Number of Accidents',
+        legend_title='Accident Cause',
+        colors=PALETTE5
     )
-    fig_bar.update_layout(barmode='stack')
-    st.plotly_chart(fig_bar, use_container_width=True)
 
-    # Line Chart
-    fig_line = px.line(
-        monthly_data,
+@st.cache_resource
+def monthly_line_fig():
+    return line_figure(
+        load_data("monthly_accidents.parquet"),
         x='Month',
-        y=['Distracted Driving', 'Drunk Driving', 'Mechanical Failure', 'Speeding', 'Weather'],
+        columns=['Distracted Driving', 'Drunk Driving', 'Mechanical Failure', 'Speeding', 'Weather'],
         title="Monthly Trends of Road Accidents by Cause",
-        labels={'value': 'Number of Accidents', 'variable': 'Accident Cause'},
-        markers=True,
-        color_discrete_sequence=[COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['gray'], COLORS['red']]
+        x_title='Month',
+        y_title='Number of Accidents',
+        legend_title='Accident Cause',
+        colors=PALETTE5
     )
-    st.plotly_chart(fig_line, use_container_width=True)
 
-    st.markdown("""
-    ### Data Storytelling: Monthly Trends in Road Accident Causes
-    The analysis of monthly accident data reveals insightful patterns...
-    - **May** emerges as the **riskiest month** with the highest total number of road accidents...
-    - **Safety campaigns** and **law enforcement measures** should intensify during **May and June**...
-    """)
-
-elif section == "Daily Trends":
-    st.header("Accidents by Day of the Week")
-    # Stacked Bar Chart
-    fig_bar = px.bar(
-        daily_data,
+@st.cache_resource
+def daily_bar_fig():
+    return stacked_bar_figure(
+        load_data("daily_accidents.parquet"),
         x='Accident Cause',
-        y=['Friday', 'Monday', 'Saturday', 'Sunday', 'Thursday', 'Tuesday', 'Wednesday'],
+        columns=['Friday', 'Monday', 'Saturday', 'Sunday', 'Thursday', 'Tuesday', 'Wednesday'],
         title="Accident Causes by Day of Week",
-        labels={'value': 'Number of Accidents', 'variable': 'Day of Week'},
-        color_discrete_sequence=[COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['gray'], COLORS['red'], '#8B5CF6', '#EC4899']
+        x_title='Accident Cause',
+        y_title='Number of Accidents',
+        legend_title='Day of Week',
+        colors=PALETTE7
     )
-    fig_bar.update_layout(barmode='stack')
-    st.plotly_chart(fig_bar, use_container_width=True)
 
-    # Line Chart
-    fig_line = px.line(
-        daily_data.set_index('Accident Cause').T.reset_index(),
-        x='index',
-        y=['Weather', 'Drunk Driving', 'Mechanical Failure', 'Speeding', 'Distracted Driving'],
+@st.cache_resource
+def daily_line_fig():
+    return line_figure(
+        load_transposed("daily_accidents.parquet", 'Day of Week'),
+        x='Day of Week',
+        columns=['Weather', 'Drunk Driving', 'Mechanical Failure', 'Speeding', 'Distracted Driving'],
         title="Accident Causes by Day of the Week",
-        labels={'index': 'Day of Week', 'value': 'Number of Accidents', 'variable': 'Accident Cause'},
-        markers=True,
-        color_discrete_sequence=[COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['gray'], COLORS['red']]
+        x_title='Day of Week',
+        y_title='Number of Accidents',
+        legend_title='Accident Cause',
+        colors=PALETTE5
     )
-    st.plotly_chart(fig_line, use_container_width=True)
-
-    st.markdown("""
-    ### Wednesday—The Unexpected Danger Day on Roads
-    The analysis of road accidents by day of the week reveals an insightful and somewhat unexpected trend...
-    - **Midweek fatigue**, where drivers may be mentally drained...
-    - **Midweek road safety campaigns** could prove crucial...
-    """)
 
-elif section == "Time of Day":
-    st.header("Accidents by Time of Day")
-    # Stacked Bar Chart
-    fig_bar = px.bar(
-        time_data,
+@st.cache_resource
+def time_bar_fig():
+    return stacked_bar_figure(
+        load_data("time_accidents.parquet"),
         x='Accident Cause',
-        y=['Afternoon', 'Evening', 'Morning', 'Night'],
+        columns=['Afternoon', 'Evening', 'Morning', 'Night'],
         title="Accident Causes by Time of Day",
-        labels={'value': 'Number of Accidents', 'variable': 'Time of Day'},
-        color_discrete_sequence=[COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['gray']]
+        x_title='Accident Cause',
+        y_title='Number of Accidents',
+        legend_title='Time of Day',
+        colors=PALETTE4
     )
-    fig_bar.update_layout(barmode='stack')
-    st.plotly_chart(fig_bar, use_container_width=True)
 
-    # Line Chart
-    fig_line = px.line(
-        time_data.set_index('Accident Cause').T.reset_index(),
-        x='index',
-        y=['Mechanical Failure', 'Drunk Driving', 'Speeding', 'Distracted Driving', 'Weather'],
+@st.cache_resource
+def time_line_fig():
+    return line_figure(
+        load_transposed("time_accidents.parquet", 'Time of Day'),
+        x='Time of Day',
+        columns=['Mechanical Failure', 'Drunk Driving', 'Speeding', 'Distracted Driving', 'Weather'],
         title="Accident Causes by Time of Day",
-        labels={'index': 'Time of Day', 'value': 'Number of Accidents', 'variable': 'Accident Cause'},
-        markers=True,
-        color_discrete_sequence=[COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['gray'], COLORS['red']]
+        x_title='Time of Day',
+        y_title='Number of Accidents',
+        legend_title='Accident Cause',
+        colors=PALETTE5
     )
-    st.plotly_chart(fig_line, use_container_width=True)
 
-    st.markdown("""
-    ### How Time of Day Influences Road Accidents by Cause
-    The data clearly reveals that time of day significantly impacts the type and frequency of road accidents...
-    - **Evening and Night** hours are the most dangerous periods...
-    - **Increased nighttime patrols** and **alcohol checkpoints** could help...
-    """)
-
-elif section == "Road Type and Location":
-    st.header("Accidents by Road Type and Location")
-    # Heatmap
-    fig_heatmap = go.Figure(data=go.Heatmap(
-        z=road_type_data[['Minor', 'Moderate', 'Severe']].values,
-        x=['Minor', 'Moderate', 'Severe'],
-        y=road_type_data['Urban/Rural'] + ' - ' + road_type_data['Road Type'],
-        colorscale='YlOrRd',
-        showscale=True
-    ))
-    fig_heatmap.update_layout(
+@st.cache_resource
+def road_type_heatmap_fig():
+    road_type_data = load_data("road_type_severity.parquet")
+    severity_values = road_type_data[['Minor', 'Moderate', 'Severe']].values
+    if severity_values.size > HEATMAP_RASTER_CELLS:
+        fig = raster_heatmap_figure(
+            severity_values,
+            ['Minor', 'Moderate', 'Severe'],
+            (road_type_data['Urban/Rural'] + ' - ' + road_type_data['Road Type']).tolist(),
+            'YlOrRd'
+        )
+    else:
+        fig = go.Figure(data=go.Heatmap(
+            z=severity_values,
+            x=['Minor', 'Moderate', 'Severe'],
+            y=road_type_data['Urban/Rural'] + ' - ' + road_type_data['Road Type'],
+            colorscale='YlOrRd',
+            showscale=True,
+            hoverongaps=False
+        ))
+    fig.update_layout(
         title="Accident Severity by Road Type and Location",
         xaxis_title="Accident Severity",
         yaxis_title="Urban/Rural & Road Type"
     )
-    st.plotly_chart(fig_heatmap, use_container_width=True)
-
-    st.markdown("""
-    ### How Road Type and Location Influence Accident Severity
-    The data reveals that accident severity varies significantly depending on the road type...
-    - **Rural Areas**: Highways record the highest number of severe accidents...
-    - **Urban Areas**: Main roads have the highest severe accident count...
-    """)
-
-elif section == "Weather Conditions":
-    st.header("Accidents by Weather Conditions")
-    # Bar Chart
-    weather_counts = filtered_data['Weather Conditions'].value_counts().reindex(['Windy', 'Rainy', 'Clear', 'Snowy', 'Foggy'])
-    fig_bar = px.bar(
-        x=weather_counts.index,
-        y=weather_counts.values,
+    return fig
+
+@st.cache_resource(max_entries=FILTER_STATE_LIMIT)
+def weather_counts_fig(years, causes, regions):
+    counts = weather_counts(years, causes, regions)
+    fig = go.Figure()
+    fig.add_bar(x=counts.index, y=counts.values, marker_color=COLORS['primary'])
+    fig.update_layout(
         title="Accident Frequency by Weather Condition",
-        labels={'x': 'Weather Condition', 'y': 'Number of Accidents'},
-        color_discrete_sequence=[COLORS['primary']]
+        xaxis_title='Weather Condition',
+        yaxis_title='Number of Accidents',
+        hovermode='x unified',
+        spikedistance=0
     )
-    st.plotly_chart(fig_bar, use_container_width=True)
+    return fig
 
-    # Stacked Bar Chart
-    fig_stacked = px.bar(
-        weather_data,
+@st.cache_resource
+def weather_severity_fig():
+    return stacked_bar_figure(
+        load_data("weather_severity.parquet"),
         x='Weather Conditions',
-        y=['Minor', 'Moderate', 'Severe'],
+        columns=['Minor', 'Moderate', 'Severe'],
         title="Accident Severity Distribution by Weather Condition",
-        labels={'value': 'Number of Accidents', 'variable': 'Accident Severity'},
-        color_discrete_sequence=[COLORS['primary'], COLORS['secondary'], COLORS['accent']]
+        x_title='Weather Conditions',
+        y_title='Number of Accidents',
+        legend_title='Accident Severity',
+        colors=PALETTE3
     )
-    fig_stacked.update_layout(barmode='stack')
-    st.plotly_chart(fig_stacked, use_container_width=True)
-
-    st.markdown("""
-    ### The Hidden Dangers of Weather Conditions on Road Accident Severity
-    This data shows that adverse weather conditions have a noticeable impact...
-    - **Rainy Conditions**: Highest severe accident count...
-    - **Road safety measures** like weather-responsive speed limits...
-    """)
 
-elif section == "Outcomes by Cause":
-    st.header("Outcomes by Accident Cause")
-    # Stacked Bar Chart
-    fig_bar = px.bar(
-        severity_data,
+@st.cache_resource
+def severity_bar_fig():
+    return stacked_bar_figure(
+        load_data("severity_by_cause.parquet"),
         x='Accident Cause',
-        y=['Minor', 'Moderate', 'Severe'],
+        columns=['Minor', 'Moderate', 'Severe'],
         title="Accident Severity by Accident Cause",
-        labels={'value': 'Number of Accidents', 'variable': 'Accident Severity'},
-        color_discrete_sequence=[COLORS['primary'], COLORS['secondary'], COLORS['accent']]
+        x_title='Accident Cause',
+        y_title='Number of Accidents',
+        legend_title='Accident Severity',
+        colors=PALETTE3
     )
-    fig_bar.update_layout(barmode='stack')
-    st.plotly_chart(fig_bar, use_container_width=True)
 
-    # Line Chart
-    fig_line = px.line(
-        severity_data,
+@st.cache_resource
+def severity_line_fig():
+    return line_figure(
+        load_data("severity_by_cause.parquet"),
         x='Accident Cause',
-        y=['Minor', 'Moderate', 'Severe'],
+        columns=['Minor', 'Moderate', 'Severe'],
         title="Accident Severity by Accident Cause",
-        labels={'value': 'Number of Accidents', 'variable': 'Severity Level'},
-        markers=True,
-        color_discrete_sequence=[COLORS['primary'], COLORS['secondary'], COLORS['accent']]
+        x_title='Accident Cause',
+        y_title='Number of Accidents',
+        legend_title='Severity Level',
+        colors=PALETTE3
     )
-    st.plotly_chart(fig_line, use_container_width=True)
 
-    st.markdown("""
-    ### Outcomes by Accident Cause
-    Distracted Driving is the leading cause of severe accidents...
-    - **Efforts to reduce distracted and drunk driving** could have the biggest impact...
-    """)
+# Narratives shown under each section's charts
+YEARLY_NARRATIVE = """
+### Data Storytelling: Yearly Trends in Road Accident Causes
+This grouped table reveals how various accident causes have evolved over the years...
+- **Overspeeding** consistently dominates the chart...
+- **Driver inattention** and **alcohol influence** also maintain a persistent presence...
+- The year **2002** recorded the **highest number of total road accidents (5,433)**...
+- Continued investment in **speed control technologies**, **public education**, and **law enforcement** is essential...
+"""
+
+MONTHLY_NARRATIVE = """
+### Data Storytelling: Monthly Trends in Road Accident Causes
+The analysis of monthly accident data reveals insightful patterns...
+- **May** emerges as the **riskiest month** with the highest total number of road accidents...
+- **Safety campaigns** and **law enforcement measures** should intensify during **May and June**...
+"""
+
+DAILY_NARRATIVE = """
+### Wednesday—The Unexpected Danger Day on Roads
+The analysis of road accidents by day of the week reveals an insightful and somewhat unexpected trend...
+- **Midweek fatigue**, where drivers may be mentally drained...
+- **Midweek road safety campaigns** could prove crucial...
+"""
+
+TIME_NARRATIVE = """
+### How Time of Day Influences Road Accidents by Cause
+The data clearly reveals that time of day significantly impacts the type and frequency of road accidents...
+- **Evening and Night** hours are the most dangerous periods...
+- **Increased nighttime patrols** and **alcohol checkpoints** could help...
+"""
+
+ROAD_TYPE_NARRATIVE = """
+### How Road Type and Location Influence Accident Severity
+The data reveals that accident severity varies significantly depending on the road type...
+- **Rural Areas**: Highways record the highest number of severe accidents...
+- **Urban Areas**: Main roads have the highest severe accident count...
+"""
+
+WEATHER_NARRATIVE = """
+### The Hidden Dangers of Weather Conditions on Road Accident Severity
+This data shows that adverse weather conditions have a noticeable impact...
+- **Rainy Conditions**: Highest severe accident count...
+- **Road safety measures** like weather-responsive speed limits...
+"""
+
+OUTCOMES_NARRATIVE = """
+### Outcomes by Accident Cause
+Distracted Driving is the leading cause of severe accidents...
+- **Efforts to reduce distracted and drunk driving** could have the biggest impact...
+"""
+
+# Section renderers
+def render_yearly():
+    st.header("Yearly Trends in Road Accidents")
+    # Stacked Bar Chart
+    st.plotly_chart(yearly_bar_fig(), use_container_width=True)
+
+    # Line Chart
+    st.plotly_chart(yearly_line_fig(), use_container_width=True)
+
+    st.markdown(YEARLY_NARRATIVE)
+
+def render_monthly():
+    st.header("Monthly Trends in Road Accidents")
+    # Stacked Bar Chart
+    st.plotly_chart(monthly_bar_fig(), use_container_width=True)
+
+    # Line Chart
+    st.plotly_chart(monthly_line_fig(), use_container_width=True)
+
+    st.markdown(MONTHLY_NARRATIVE)
+
+def render_daily():
+    st.header("Accidents by Day of the Week")
+    # Stacked Bar Chart
+    st.plotly_chart(daily_bar_fig(), use_container_width=True)
+
+    # Line Chart
+    st.plotly_chart(daily_line_fig(), use_container_width=True)
+
+    st.markdown(DAILY_NARRATIVE)
+
+def render_time():
+    st.header("Accidents by Time of Day")
+    # Stacked Bar Chart
+    st.plotly_chart(time_bar_fig(), use_container_width=True)
+
+    # Line Chart
+    st.plotly_chart(time_line_fig(), use_container_width=True)
+
+    st.markdown(TIME_NARRATIVE)
+
+def render_road_type():
+    st.header("Accidents by Road Type and Location")
+    # Heatmap
+    st.plotly_chart(road_type_heatmap_fig(), use_container_width=True)
+
+    st.markdown(ROAD_TYPE_NARRATIVE)
+
+def render_weather():
+    filter_key = sidebar_filters()
+    st.header("Accidents by Weather Conditions")
+    # Bar Chart
+    st.plotly_chart(weather_counts_fig(*filter_key), use_container_width=True)
+
+    # Stacked Bar Chart
+    st.plotly_chart(weather_severity_fig(), use_container_width=True)
+
+    st.markdown(WEATHER_NARRATIVE)
+
+def render_outcomes():
+    st.header("Outcomes by Accident Cause")
+    # Stacked Bar Chart
+    st.plotly_chart(severity_bar_fig(), use_container_width=True)
+
+    # Line Chart
+    st.plotly_chart(severity_line_fig(), use_container_width=True)
+
+    st.markdown(OUTCOMES_NARRATIVE)
+
+SECTIONS = {
+    "Yearly Trends": render_yearly,
+    "Monthly Trends": render_monthly,
+    "Daily Trends": render_daily,
+    "Time of Day": render_time,
+    "Road Type and Location": render_road_type,
+    "Weather Conditions": render_weather,
+    "Outcomes by Cause": render_outcomes
+}
+
+# Section rendering
+st.title("Road Accident Analysis Dashboard")
+
+SECTIONS[section]()
 
 # Footer
-st.markdown(
-    f"""
-    <div class="footer">
-        <p>Created for portfolio showcase | biult by Sammdetech.com</p>
-    </div>
-    """,
-    unsafe_allow_html=True
-)
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)